@@ -2,12 +2,17 @@ from __future__ import annotations
 
 import json
 import os
-from pathlib import Path
 from typing import Any, Callable
 
 from openai import APIStatusError, OpenAI, RateLimitError
 
 from sentinel_trend.agents.tools import tool_compare_variants, tool_real_backtest
+from sentinel_trend.backtest.reports import runs_dir
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is a declared dependency
+    orjson = None
 
 
 _SYSTEM_PROMPT = """You are a Research Agent for sentinel_trend.
@@ -20,47 +25,59 @@ Write the report content only; do not fabricate numbers.
 """
 
 
-def _tool_definitions() -> list[dict[str, Any]]:
-    """
-    Responses API tool schema requires tool 'name' at the top level for type=function.
-    (This differs from the nested 'function': {...} schema used in some other APIs.)
-    """
-    return [
-        {
-            "type": "function",
-            "name": "real_backtest",
-            "description": "Run a real backtest for a single SMA window.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "sma_window": {"type": "integer", "minimum": 1},
-                    "cost_bps": {"type": "number", "minimum": 0},
-                    "refresh": {"type": "boolean"},
-                },
-                "required": ["sma_window", "cost_bps", "refresh"],
-                "additionalProperties": False,
+# Responses API tool schema requires tool 'name' at the top level for type=function.
+# (This differs from the nested 'function': {...} schema used in some other APIs.)
+# Built once at import; the same list is sent on every request.
+_TOOL_DEFINITIONS: list[dict[str, Any]] = [
+    {
+        "type": "function",
+        "name": "real_backtest",
+        "description": "Run a real backtest for a single SMA window.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "sma_window": {"type": "integer", "minimum": 1},
+                "cost_bps": {"type": "number", "minimum": 0},
+                "refresh": {"type": "boolean"},
             },
+            "required": ["sma_window", "cost_bps", "refresh"],
+            "additionalProperties": False,
         },
-        {
-            "type": "function",
-            "name": "compare_variants",
-            "description": "Compare multiple SMA windows and return robustness verdict.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "windows": {
-                        "type": "array",
-                        "items": {"type": "integer", "minimum": 1},
-                        "minItems": 1,
-                    },
-                    "cost_bps": {"type": "number", "minimum": 0},
-                    "refresh": {"type": "boolean"},
+    },
+    {
+        "type": "function",
+        "name": "compare_variants",
+        "description": "Compare multiple SMA windows and return robustness verdict.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "windows": {
+                    "type": "array",
+                    "items": {"type": "integer", "minimum": 1},
+                    "minItems": 1,
                 },
-                "required": ["windows", "cost_bps", "refresh"],
-                "additionalProperties": False,
+                "cost_bps": {"type": "number", "minimum": 0},
+                "refresh": {"type": "boolean"},
             },
+            "required": ["windows", "cost_bps", "refresh"],
+            "additionalProperties": False,
         },
-    ]
+    },
+]
+
+
+def _json_dumps(obj: Any) -> str:
+    if orjson is not None:
+        # Tool results are keyed by int window; json.dumps stringifies those keys.
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, default=str)
+
+
+def _json_loads(text: str) -> Any:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch one type.
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
 
 
 def _as_dict(obj: Any) -> dict[str, Any]:
@@ -77,20 +94,29 @@ def _as_dict(obj: Any) -> dict[str, Any]:
     return {}
 
 
+def _item_field(item: Any, key: str) -> Any:
+    if isinstance(item, dict):
+        return item.get(key)
+    return getattr(item, key, None)
+
+
 def _extract_function_calls(response: Any) -> list[dict[str, Any]]:
     """
     Responses API returns tool calls in response.output as items with type == 'function_call'.
+    Only name/arguments/call_id are needed, so read them as attributes instead of
+    dumping each SDK object.
     """
-    output = getattr(response, "output", None)
-    if not output:
-        return []
-    calls: list[dict[str, Any]] = []
-    for item in output:
-        item_d = _as_dict(item)
-        item_type = item_d.get("type") or getattr(item, "type", None)
-        if item_type == "function_call":
-            calls.append(item_d)
-    return calls
+    output = getattr(response, "output", None) or []
+    return [
+        {
+            "name": _item_field(item, "name"),
+            "arguments": _item_field(item, "arguments"),
+            "call_id": _item_field(item, "call_id"),
+            "id": _item_field(item, "id"),
+        }
+        for item in output
+        if _item_field(item, "type") == "function_call"
+    ]
 
 
 def _parse_call(call: dict[str, Any]) -> tuple[str, dict[str, Any], str]:
@@ -108,7 +134,7 @@ def _parse_call(call: dict[str, Any]) -> tuple[str, dict[str, Any], str]:
 
     if isinstance(arguments, str):
         try:
-            args = json.loads(arguments) if arguments.strip() else {}
+            args = _json_loads(arguments) if arguments.strip() else {}
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON arguments for tool {name}: {arguments}") from e
     elif isinstance(arguments, dict):
@@ -168,7 +194,6 @@ def run_agent_research(refresh: bool) -> str:
         raise RuntimeError("OPENAI_API_KEY is not set; source your .env (e.g. `source .env`).")
 
     client = OpenAI()
-    tools = _tool_definitions()
 
     # Tool implementations
     tool_map: dict[str, Callable[..., dict[str, Any]]] = {
@@ -183,7 +208,7 @@ def run_agent_research(refresh: bool) -> str:
             {"role": "system", "content": _SYSTEM_PROMPT},
             {"role": "user", "content": "Run the research workflow now."},
         ],
-        tools=tools,
+        tools=_TOOL_DEFINITIONS,
     )
 
     # Tool loop
@@ -192,9 +217,7 @@ def run_agent_research(refresh: bool) -> str:
 
         if not calls:
             report_text = _extract_text(response)
-            runs_dir = Path("runs")
-            runs_dir.mkdir(parents=True, exist_ok=True)
-            report_path = runs_dir / "agent_research_report.md"
+            report_path = runs_dir() / "agent_research_report.md"
             report_path.write_text(report_text, encoding="utf-8")
             return str(report_path)
 
@@ -216,7 +239,7 @@ def run_agent_research(refresh: bool) -> str:
                 {
                     "type": "function_call_output",
                     "call_id": call_id,
-                    "output": json.dumps(result),
+                    "output": _json_dumps(result),
                 }
             )
 
@@ -224,7 +247,7 @@ def run_agent_research(refresh: bool) -> str:
             client,
             model="gpt-4.1-mini",
             input=tool_outputs,
-            tools=tools,
+            tools=_TOOL_DEFINITIONS,
             previous_response_id=response.id,
         )
 
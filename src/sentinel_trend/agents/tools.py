@@ -1,52 +1,45 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from pathlib import Path
 from typing import Any
 
 from sentinel_trend.backtest.engine import run_backtest
 from sentinel_trend.backtest.metrics import (
-    cagr,
-    max_drawdown,
+    compute_all_metrics,
     turnover_avg_equity,
     turnover_initial,
-    volatility,
 )
-from sentinel_trend.backtest.reports import write_decision_record
-from sentinel_trend.data.calendar import intersect_trading_days, trading_days_from_prices
+from sentinel_trend.backtest.reports import runs_dir, write_decision_record
+from sentinel_trend.data.aligned import load_aligned_prices
 from sentinel_trend.data.qa import run_all_checks
-from sentinel_trend.data.stooq import get_prices
-from sentinel_trend.strategy.trend_sma import make_trend_decisions
+from sentinel_trend.strategy.trend_sma import make_trend_decision_arrays
 
 
 def _iso_range(start: date, end: date) -> str:
     return f"{start.isoformat()} to {end.isoformat()}"
 
 
-def tool_real_backtest(sma_window: int, cost_bps: float, refresh: bool) -> dict:
-    cache_dir = ".cache/stooq"
-    spy_prices = get_prices("SPY", cache_dir=cache_dir, force_refresh=refresh)
-    bil_prices = get_prices("BIL", cache_dir=cache_dir, force_refresh=refresh)
+def tool_real_backtest(
+    sma_window: int,
+    cost_bps: float,
+    refresh: bool,
+    output_dir: Path | None = None,
+) -> dict:
+    trading_days, spy_prices, bil_prices = load_aligned_prices(refresh)
 
-    trading_days = intersect_trading_days(
-        trading_days_from_prices(spy_prices),
-        trading_days_from_prices(bil_prices),
+    decisions = make_trend_decision_arrays(
+        trading_days, spy_prices.values, window=sma_window
     )
-    spy_prices = {day: spy_prices[day] for day in trading_days}
-    bil_prices = {day: bil_prices[day] for day in trading_days}
-
-    decisions = make_trend_decisions(trading_days, spy_prices, window=sma_window)
     result = run_backtest(
         trading_days,
-        prices_by_asset={"SPY": spy_prices, "BIL": bil_prices},
+        prices_by_asset={"SPY": spy_prices.values, "BIL": bil_prices.values},
         decisions=decisions,
         initial_value=100_000.0,
         cost_bps=cost_bps,
     )
-    metrics = {
-        "cagr": cagr(result.equity_curve),
-        "max_drawdown": max_drawdown(result.equity_curve),
-        "volatility": volatility(result.equity_curve),
+    metrics = compute_all_metrics(result.equity_curve) | {
         "turnover_initial": turnover_initial(result.trades, result.initial_value),
         "turnover_avg_equity": turnover_avg_equity(
             result.trades, result.equity_curve
@@ -54,9 +47,9 @@ def tool_real_backtest(sma_window: int, cost_bps: float, refresh: bool) -> dict:
         "trade_count": len(result.trades),
     }
 
-    runs_dir = Path("runs")
-    runs_dir.mkdir(parents=True, exist_ok=True)
-    report_path = runs_dir / f"real_decision_record_{sma_window}.md"
+    if output_dir is None:
+        output_dir = runs_dir()
+    report_path = output_dir / f"real_decision_record_{sma_window}.md"
     config = {
         "assets": ["SPY", "BIL"],
         "sma_window": sma_window,
@@ -88,9 +81,19 @@ def tool_compare_variants(
     cost_bps: float,
     refresh: bool,
 ) -> dict:
-    results: dict[int, dict] = {}
-    for window in windows:
-        results[window] = tool_real_backtest(window, cost_bps, refresh)
+    # Windows are independent. Prices load once under load_aligned_prices' lock;
+    # the threads then run the CPU-bound backtests and decision-record writes.
+    output_dir = runs_dir()
+    with ThreadPoolExecutor(max_workers=max(len(windows), 1)) as executor:
+        futures = {
+            window: executor.submit(
+                tool_real_backtest, window, cost_bps, refresh, output_dir
+            )
+            for window in windows
+        }
+        results: dict[int, dict] = {
+            window: future.result() for window, future in futures.items()
+        }
 
     cagr_values = [results[w]["cagr"] for w in windows]
     dd_values = [results[w]["max_drawdown"] for w in windows]
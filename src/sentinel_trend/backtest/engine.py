@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import bisect
 from dataclasses import dataclass
 from datetime import date
-from typing import Mapping, Sequence
+from typing import Mapping, Sequence, Union
+
+import numpy as np
 
 from sentinel_trend.backtest.costs import apply_cost
-from sentinel_trend.strategy.trend_sma import TrendDecision
+from sentinel_trend.strategy.trend_sma import (
+    TARGET_ASSETS,
+    TrendDecision,
+    TrendDecisions,
+)
 
 
 @dataclass(frozen=True)
@@ -19,10 +26,69 @@ class BacktestResult:
     trades: list[dict]
 
 
+PriceInput = Union[Mapping[date, float], np.ndarray]
+
+
+def _price_array(
+    prices: PriceInput, trading_days: Sequence[date], start_idx: int
+) -> np.ndarray:
+    # Arrays are taken to be aligned with trading_days. For mappings, missing
+    # days become NaN and are only an error if the asset is held across them.
+    if isinstance(prices, np.ndarray):
+        if len(prices) != len(trading_days):
+            raise ValueError("price array length must match trading_days")
+        return np.asarray(prices[start_idx:], dtype=np.float64)
+    days = trading_days[start_idx:]
+    return np.fromiter(
+        (prices.get(day, np.nan) for day in days),
+        dtype=np.float64,
+        count=len(days),
+    )
+
+
+def _trade_marks(
+    trading_days: Sequence[date],
+    decisions: Sequence[TrendDecision] | TrendDecisions,
+) -> tuple[int, np.ndarray]:
+    """
+    Return the index of the first trade day and, for each day from there on, the
+    TARGET_ASSETS code traded into on that day or -1 if there is no decision.
+    """
+    if isinstance(decisions, TrendDecisions) and decisions.trading_days is trading_days:
+        # Built on this exact calendar: the indices can be used as-is.
+        start_idx = int(decisions.trade_idx.min())
+        marks = np.full(len(trading_days) - start_idx, -1, dtype=np.int8)
+        marks[decisions.trade_idx - start_idx] = decisions.target
+        return start_idx, marks
+
+    # One pass builds the lookup and finds the earliest trade date; decisions from
+    # make_trend_decisions are already ascending, but other callers need not be.
+    decisions_by_date: dict[date, TrendDecision] = {}
+    start_date = decisions[0].trade_date
+    for decision in decisions:
+        decisions_by_date[decision.trade_date] = decision
+        if decision.trade_date < start_date:
+            start_date = decision.trade_date
+
+    # trading_days is ascending, so locate days by binary search rather than
+    # scanning or indexing the whole calendar.
+    start_idx = bisect.bisect_left(trading_days, start_date)
+    if start_idx == len(trading_days) or trading_days[start_idx] != start_date:
+        raise ValueError("start_date not in trading_days")
+
+    days = trading_days[start_idx:]
+    marks = np.full(len(days), -1, dtype=np.int8)
+    for trade_date, decision in decisions_by_date.items():
+        idx = bisect.bisect_left(days, trade_date)
+        if idx < len(days) and days[idx] == trade_date:
+            marks[idx] = TARGET_ASSETS.index(decision.target_asset)
+    return start_idx, marks
+
+
 def run_backtest(
     trading_days: Sequence[date],
-    prices_by_asset: Mapping[str, Mapping[date, float]],
-    decisions: Sequence[TrendDecision],
+    prices_by_asset: Mapping[str, PriceInput],
+    decisions: Sequence[TrendDecision] | TrendDecisions,
     initial_value: float = 100_000.0,
     cost_bps: float = 5.0,
 ) -> BacktestResult:
@@ -34,66 +100,62 @@ def run_backtest(
     if prices_spy is None or prices_bil is None:
         raise ValueError("prices_by_asset must contain SPY and BIL")
 
-    trade_dates = {d.trade_date for d in decisions}
-    start_date = min(trade_dates)
-    end_date = trading_days[-1]
-    if start_date not in trading_days:
-        raise ValueError("start_date not in trading_days")
-
-    first_decision = min(decisions, key=lambda d: d.trade_date)
-    current_asset = first_decision.target_asset
-    value = initial_value
+    start_idx, marks = _trade_marks(trading_days, decisions)
+    days = list(trading_days[start_idx:])
+    n_days = len(days)
+
+    # Forward-fill the trade-day marks into a holding per day. The first day
+    # always carries the first decision.
+    last_mark = np.where(marks >= 0, np.arange(n_days), 0)
+    np.maximum.accumulate(last_mark, out=last_mark)
+    held = marks[last_mark]
+
+    # Daily growth of the asset held coming into each day, then trade costs on
+    # the days the holding changes.
+    prices = np.vstack(
+        [
+            _price_array(prices_bil, trading_days, start_idx),
+            _price_array(prices_spy, trading_days, start_idx),
+        ]
+    )
+    prev_held = held[:-1]
+    steps = np.arange(1, n_days)
+    ratios = prices[prev_held, steps] / prices[prev_held, steps - 1]
+    if np.isnan(ratios).any():
+        raise ValueError("missing price for held asset")
+
+    switch_idx = np.flatnonzero(held[1:] != held[:-1]) + 1
+    factors = np.empty(n_days, dtype=np.float64)
+    factors[0] = initial_value
+    factors[1:] = ratios
+    factors[switch_idx] *= apply_cost(apply_cost(1.0, cost_bps), cost_bps)
+    equity = np.cumprod(factors)
 
     trades: list[dict] = []
-    equity_curve: list[tuple[date, float]] = []
-    holdings: list[tuple[date, str]] = []
-
-    prev_day: date | None = None
-    for day in trading_days:
-        if day < start_date:
-            continue
-
-        if prev_day is not None:
-            price_map = prices_spy if current_asset == "SPY" else prices_bil
-            if prev_day not in price_map or day not in price_map:
-                raise ValueError("missing price for held asset")
-            value *= price_map[day] / price_map[prev_day]
-
-        if day in trade_dates:
-            decision = next(d for d in decisions if d.trade_date == day)
-            if decision.target_asset != current_asset:
-                value_before = value
-                value_after_sell = apply_cost(value, cost_bps)
-                from_asset = current_asset
-                current_asset = decision.target_asset
-                value_after_buy = apply_cost(value_after_sell, cost_bps)
-                sell_cost_amount = value_before - value_after_sell
-                buy_cost_amount = value_after_sell - value_after_buy
-                notional_sold = value_before
-                notional_bought = value_after_sell
-                value = value_after_buy
-                trades.append(
-                    {
-                        "date": day,
-                        "from_asset": from_asset,
-                        "to_asset": current_asset,
-                        "value_before": value_before,
-                        "value_after_sell": value_after_sell,
-                        "value_after_buy": value_after_buy,
-                        "cost_bps": cost_bps,
-                        "sell_cost_amount": sell_cost_amount,
-                        "buy_cost_amount": buy_cost_amount,
-                        "notional_sold": notional_sold,
-                        "notional_bought": notional_bought,
-                    }
-                )
-
-        equity_curve.append((day, value))
-        holdings.append((day, current_asset))
-        prev_day = day
-
-    if not equity_curve:
-        raise ValueError("equity_curve is empty")
+    for idx in switch_idx.tolist():
+        value_before = float(equity[idx - 1] * ratios[idx - 1])
+        value_after_sell = apply_cost(value_before, cost_bps)
+        value_after_buy = apply_cost(value_after_sell, cost_bps)
+        trades.append(
+            {
+                "date": days[idx],
+                "from_asset": TARGET_ASSETS[held[idx - 1]],
+                "to_asset": TARGET_ASSETS[held[idx]],
+                "value_before": value_before,
+                "value_after_sell": value_after_sell,
+                "value_after_buy": value_after_buy,
+                "cost_bps": cost_bps,
+                "sell_cost_amount": value_before - value_after_sell,
+                "buy_cost_amount": value_after_sell - value_after_buy,
+                "notional_sold": value_before,
+                "notional_bought": value_after_sell,
+            }
+        )
+
+    equity_curve = list(zip(days, equity.tolist()))
+    holdings = [
+        (day, TARGET_ASSETS[code]) for day, code in zip(days, held.tolist())
+    ]
 
     return BacktestResult(
         start_date=equity_curve[0][0],
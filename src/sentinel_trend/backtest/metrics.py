@@ -1,22 +1,45 @@
 from __future__ import annotations
 
 from datetime import date
-from math import sqrt
-from typing import Sequence
+from typing import Callable, Sequence, Union
 
+import numpy as np
 
-def max_drawdown(equity_curve: Sequence[tuple[date, float]]) -> float:
-    if not equity_curve:
+EquityInput = Union[Sequence[tuple[date, float]], np.ndarray]
+
+
+def equity_values(equity_curve: EquityInput) -> np.ndarray:
+    """Return equity values as a float64 array; arrays are passed through as-is."""
+    if isinstance(equity_curve, np.ndarray):
+        return equity_curve.astype(np.float64, copy=False)
+    return np.fromiter(
+        (value for _, value in equity_curve),
+        dtype=np.float64,
+        count=len(equity_curve),
+    )
+
+
+def _max_drawdown_of(values: np.ndarray) -> float:
+    peaks = np.maximum.accumulate(values)
+    return float(((values - peaks) / peaks).min())
+
+
+def _cagr_of(days: int, start_value: float, end_value: float) -> float:
+    if days <= 0:
+        raise ValueError("equity_curve must span positive time")
+    years = days / 365.25
+    return (end_value / start_value) ** (1.0 / years) - 1.0
+
+
+def _volatility_of(values: np.ndarray) -> float:
+    returns = values[1:] / values[:-1] - 1.0
+    return float(returns.std(ddof=0) * np.sqrt(252.0))
+
+
+def max_drawdown(equity_curve: EquityInput) -> float:
+    if len(equity_curve) == 0:
         raise ValueError("equity_curve must not be empty")
-    peak = equity_curve[0][1]
-    max_dd = 0.0
-    for _, value in equity_curve:
-        if value > peak:
-            peak = value
-        drawdown = (value - peak) / peak
-        if drawdown < max_dd:
-            max_dd = drawdown
-    return max_dd
+    return _max_drawdown_of(equity_values(equity_curve))
 
 
 def cagr(equity_curve: Sequence[tuple[date, float]]) -> float:
@@ -24,43 +47,63 @@ def cagr(equity_curve: Sequence[tuple[date, float]]) -> float:
         raise ValueError("equity_curve must have at least two points")
     start_date, start_value = equity_curve[0]
     end_date, end_value = equity_curve[-1]
-    days = (end_date - start_date).days
-    if days <= 0:
-        raise ValueError("equity_curve must span positive time")
-    years = days / 365.25
-    return (end_value / start_value) ** (1.0 / years) - 1.0
+    return _cagr_of((end_date - start_date).days, start_value, end_value)
 
 
-def volatility(equity_curve: Sequence[tuple[date, float]]) -> float:
+def volatility(equity_curve: EquityInput) -> float:
     if len(equity_curve) < 2:
         raise ValueError("equity_curve must have at least two points")
-    returns: list[float] = []
-    for idx in range(1, len(equity_curve)):
-        prev = equity_curve[idx - 1][1]
-        curr = equity_curve[idx][1]
-        returns.append(curr / prev - 1.0)
-    if not returns:
-        return 0.0
-    mean = sum(returns) / len(returns)
-    var = sum((r - mean) ** 2 for r in returns) / len(returns)
-    return sqrt(var) * sqrt(252.0)
+    return _volatility_of(equity_values(equity_curve))
+
+
+def compute_all_metrics(equity_curve: Sequence[tuple[date, float]]) -> dict[str, float]:
+    """cagr, max_drawdown and volatility from one array conversion of the curve."""
+    if len(equity_curve) < 2:
+        raise ValueError("equity_curve must have at least two points")
+    values = equity_values(equity_curve)
+    start_date, start_value = equity_curve[0]
+    end_date, end_value = equity_curve[-1]
+    return {
+        "cagr": _cagr_of((end_date - start_date).days, start_value, end_value),
+        "max_drawdown": _max_drawdown_of(values),
+        "volatility": _volatility_of(values),
+    }
+
 
+def _notional_sold_bought(trade: dict) -> float:
+    return float(trade["notional_sold"]) + float(trade["notional_bought"])
 
-def _trade_notional(trade: dict) -> float:
+
+def _notional_value_before_after(trade: dict) -> float:
+    return float(trade["value_before"]) + float(trade["value_after_sell"])
+
+
+def _notional_pre_value(trade: dict) -> float:
+    return float(trade["pre_value"]) * 2.0
+
+
+def _notional_getter(trade: dict) -> Callable[[dict], float]:
+    # All trades in a list share one schema, so pick the accessor once per list.
     if "notional_sold" in trade and "notional_bought" in trade:
-        return float(trade["notional_sold"]) + float(trade["notional_bought"])
+        return _notional_sold_bought
     if "value_before" in trade and "value_after_sell" in trade:
-        return float(trade["value_before"]) + float(trade["value_after_sell"])
+        return _notional_value_before_after
     if "pre_value" in trade:
-        return float(trade["pre_value"]) * 2.0
+        return _notional_pre_value
     raise KeyError("trade does not contain notional fields")
 
 
+def _total_notional(trades: Sequence[dict]) -> float:
+    if not trades:
+        return 0.0
+    getter = _notional_getter(trades[0])
+    return sum(getter(trade) for trade in trades)
+
+
 def turnover_initial(trades: Sequence[dict], initial_value: float) -> float:
     if initial_value <= 0:
         raise ValueError("initial_value must be positive")
-    total_notional = sum(_trade_notional(trade) for trade in trades)
-    return total_notional / initial_value
+    return _total_notional(trades) / initial_value
 
 
 def turnover_avg_equity(
@@ -70,5 +113,4 @@ def turnover_avg_equity(
     if not equity_curve:
         raise ValueError("equity_curve must not be empty")
     average_equity = sum(value for _, value in equity_curve) / len(equity_curve)
-    total_notional = sum(_trade_notional(trade) for trade in trades)
-    return total_notional / average_equity
+    return _total_notional(trades) / average_equity
@@ -1,11 +1,21 @@
 from __future__ import annotations
 
 from datetime import date
+from pathlib import Path
 from typing import Any
 
 from sentinel_trend.backtest.engine import BacktestResult
 
 
+def runs_dir() -> Path:
+    """The relative ``runs`` output directory, created if missing."""
+    # A single mkdir per call; a memo would miss the directory being deleted
+    # while a long-lived process is running.
+    path = Path("runs")
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
 def _fmt_date(value: date) -> str:
     return value.isoformat()
 
@@ -16,37 +26,40 @@ def write_decision_record(
     result: BacktestResult,
     metrics: dict,
 ) -> None:
-    lines: list[str] = []
-    lines.append("# Decision Record")
-    lines.append("")
-    lines.append("## Configuration")
-    lines.append(f"- Assets: {', '.join(config.get('assets', []))}")
-    lines.append(f"- SMA Window: {config.get('sma_window')}")
-    lines.append(f"- Cost (bps per side): {config.get('cost_bps')}")
-    lines.append(f"- Date Range: {_fmt_date(result.start_date)} to {_fmt_date(result.end_date)}")
-    lines.append("")
-    lines.append("## Summary Metrics")
-    lines.append(f"- CAGR: {metrics.get('cagr'):.4f}")
-    lines.append(f"- Max Drawdown: {metrics.get('max_drawdown'):.4f}")
-    lines.append(f"- Volatility: {metrics.get('volatility'):.4f}")
-    lines.append(f"- Final Value: {result.final_value:,.2f}")
-    lines.append("")
-    lines.append("## Trades")
-    lines.append("| Date | From | To | Cost |")
-    lines.append("| --- | --- | --- | --- |")
-    for trade in result.trades:
-        cost_amount = trade["sell_cost_amount"] + trade["buy_cost_amount"]
-        lines.append(
+    with open(path, "w", encoding="utf-8", buffering=1 << 16) as handle:
+        handle.write(
+            "# Decision Record\n"
+            "\n"
+            "## Configuration\n"
+            f"- Assets: {', '.join(config.get('assets', []))}\n"
+            f"- SMA Window: {config.get('sma_window')}\n"
+            f"- Cost (bps per side): {config.get('cost_bps')}\n"
+            f"- Date Range: {_fmt_date(result.start_date)} to "
+            f"{_fmt_date(result.end_date)}\n"
+            "\n"
+            "## Summary Metrics\n"
+            f"- CAGR: {metrics.get('cagr'):.4f}\n"
+            f"- Max Drawdown: {metrics.get('max_drawdown'):.4f}\n"
+            f"- Volatility: {metrics.get('volatility'):.4f}\n"
+            f"- Final Value: {result.final_value:,.2f}\n"
+            "\n"
+            "## Trades\n"
+            "| Date | From | To | Cost |\n"
+            "| --- | --- | --- | --- |\n"
+        )
+        handle.writelines(
             f"| {_fmt_date(trade['date'])} | {trade['from_asset']} | "
-            f"{trade['to_asset']} | {cost_amount:.2f} |"
+            f"{trade['to_asset']} | "
+            f"{trade['sell_cost_amount'] + trade['buy_cost_amount']:.2f} |\n"
+            for trade in result.trades
+        )
+        handle.write(
+            "\n"
+            "## Last 10 Equity Points\n"
+            "| Date | Value |\n"
+            "| --- | --- |\n"
+        )
+        handle.writelines(
+            f"| {_fmt_date(day)} | {value:,.2f} |\n"
+            for day, value in result.equity_curve[-10:]
         )
-    lines.append("")
-    lines.append("## Last 10 Equity Points")
-    lines.append("| Date | Value |")
-    lines.append("| --- | --- |")
-    for day, value in result.equity_curve[-10:]:
-        lines.append(f"| {_fmt_date(day)} | {value:,.2f} |")
-    lines.append("")
-
-    with open(path, "w", encoding="utf-8") as handle:
-        handle.write("\n".join(lines))
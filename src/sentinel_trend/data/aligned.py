@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+from sentinel_trend.data.calendar import align
+from sentinel_trend.data.stooq import PriceSeries, get_prices
+
+AlignedPrices = tuple[list[date], PriceSeries, PriceSeries]
+
+_ALIGNED_PRICES: dict[tuple[str, bool], AlignedPrices] = {}
+_ALIGNED_PRICES_LOCK = threading.Lock()
+
+
+def load_aligned_prices(
+    refresh: bool = False,
+    cache_dir: str = ".cache/stooq",
+) -> AlignedPrices:
+    """
+    SPY/BIL restricted to their shared trading days, loaded once per process.
+
+    The lock is held while loading so concurrent callers wait for the first load
+    instead of each parsing the same CSVs. A refresh load also replaces the plain
+    entry, since it is what a plain load would now read from disk. Callers must
+    not mutate the returned containers.
+    """
+    with _ALIGNED_PRICES_LOCK:
+        cached = _ALIGNED_PRICES.get((cache_dir, refresh))
+        if cached is not None:
+            return cached
+
+        # Independent downloads/parses; wall clock is max(SPY, BIL), not the sum.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            spy_future = executor.submit(
+                get_prices, "SPY", cache_dir=cache_dir, force_refresh=refresh
+            )
+            bil_future = executor.submit(
+                get_prices, "BIL", cache_dir=cache_dir, force_refresh=refresh
+            )
+            spy_prices = spy_future.result()
+            bil_prices = bil_future.result()
+
+        common, spy_values, bil_values = align(spy_prices, bil_prices)
+        cached = (
+            common.tolist(),
+            PriceSeries(days=common, values=spy_values),
+            PriceSeries(days=common, values=bil_values),
+        )
+        _ALIGNED_PRICES[(cache_dir, refresh)] = cached
+        if refresh:
+            _ALIGNED_PRICES[(cache_dir, False)] = cached
+        return cached
@@ -3,10 +3,34 @@ from __future__ import annotations
 from datetime import date
 from typing import Mapping, Sequence
 
+import numpy as np
+
+from sentinel_trend.data.stooq import PriceSeries
+
 
 def trading_days_from_prices(prices: Mapping[date, float]) -> list[date]:
     return sorted(prices.keys())
 
 
 def intersect_trading_days(a: Sequence[date], b: Sequence[date]) -> list[date]:
-    return sorted(set(a).intersection(b))
+    """Intersect two ascending, duplicate-free calendars with a linear merge."""
+    common: list[date] = []
+    i = j = 0
+    len_a, len_b = len(a), len(b)
+    while i < len_a and j < len_b:
+        day_a, day_b = a[i], b[j]
+        if day_a == day_b:
+            common.append(day_a)
+            i += 1
+            j += 1
+        elif day_a < day_b:
+            i += 1
+        else:
+            j += 1
+    return common
+
+
+def align(a: PriceSeries, b: PriceSeries) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return the shared days and both series' values on them in one intersect."""
+    common, idx_a, idx_b = np.intersect1d(a.days, b.days, return_indices=True)
+    return common, a.values[idx_a], b.values[idx_b]
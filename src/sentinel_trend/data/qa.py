@@ -3,6 +3,10 @@ from __future__ import annotations
 from datetime import date, timedelta
 from typing import Mapping, Sequence
 
+import numpy as np
+
+from sentinel_trend.data.stooq import PriceSeries
+
 
 def check_nonempty(prices: Mapping[date, float], asset: str) -> list[str]:
     if not prices:
@@ -11,12 +15,14 @@ def check_nonempty(prices: Mapping[date, float], asset: str) -> list[str]:
 
 
 def check_monotonic_dates(prices: Mapping[date, float], asset: str) -> list[str]:
+    # Check the mapping's own (insertion) order; a sorted view would always pass.
     warnings: list[str] = []
-    dates = sorted(prices.keys())
-    for prev, curr in zip(dates, dates[1:]):
-        if curr <= prev:
+    prev: date | None = None
+    for curr in prices.keys():
+        if prev is not None and curr <= prev:
             warnings.append(f"{asset} dates are not strictly increasing")
             break
+        prev = curr
     return warnings
 
 
@@ -33,12 +39,7 @@ def check_missing_ratio(trading_days: Sequence[date]) -> list[str]:
         return warnings
     start = min(trading_days)
     end = max(trading_days)
-    expected = 0
-    current = start
-    while current <= end:
-        if current.weekday() < 5:
-            expected += 1
-        current += timedelta(days=1)
+    expected = int(np.busday_count(start, end + timedelta(days=1)))
     observed = len(trading_days)
     if expected > 0:
         missing_ratio = (expected - observed) / expected
@@ -51,14 +52,43 @@ def check_missing_ratio(trading_days: Sequence[date]) -> list[str]:
     return warnings
 
 
+def _check_asset(prices: Mapping[date, float] | PriceSeries, asset: str) -> list[str]:
+    """
+    Single pass equivalent of the nonempty, monotonic-date and non-positive checks.
+    Dates are checked in the series' stored order (a mapping's insertion order).
+    """
+    if isinstance(prices, PriceSeries):
+        if len(prices.days) == 0:
+            raise ValueError(f"{asset} prices are empty")
+        not_monotonic = bool((prices.days[1:] <= prices.days[:-1]).any())
+        nonpositive = bool((prices.values <= 0).any())
+    else:
+        if not prices:
+            raise ValueError(f"{asset} prices are empty")
+        not_monotonic = False
+        nonpositive = False
+        prev: date | None = None
+        for day, value in prices.items():
+            if value <= 0:
+                nonpositive = True
+            if prev is not None and day <= prev:
+                not_monotonic = True
+            prev = day
+
+    warnings: list[str] = []
+    if not_monotonic:
+        warnings.append(f"{asset} dates are not strictly increasing")
+    if nonpositive:
+        warnings.append(f"{asset} has non-positive prices")
+    return warnings
+
+
 def run_all_checks(
-    prices_by_asset: Mapping[str, Mapping[date, float]],
+    prices_by_asset: Mapping[str, Mapping[date, float] | PriceSeries],
     trading_days: Sequence[date],
 ) -> list[str]:
     warnings: list[str] = []
     for asset, prices in prices_by_asset.items():
-        warnings.extend(check_nonempty(prices, asset))
-        warnings.extend(check_monotonic_dates(prices, asset))
-        warnings.extend(check_nonpositive_prices(prices, asset))
+        warnings.extend(_check_asset(prices, asset))
     warnings.extend(check_missing_ratio(trading_days))
     return warnings
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
-import csv
+import gzip
+import io
+import os
+import tempfile
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
-from typing import Mapping
-from urllib.request import urlopen
+from typing import Mapping, NamedTuple
+from urllib.request import Request, urlopen
+
+import numpy as np
 
 
 _SYMBOL_MAP = {
@@ -13,6 +19,36 @@ _SYMBOL_MAP = {
 }
 
 
+class PriceSeries(NamedTuple):
+    """Daily closes as parallel arrays: ascending datetime64[D] days, float64 values."""
+
+    days: np.ndarray
+    values: np.ndarray
+
+    @classmethod
+    def from_prices(cls, prices: Mapping[date, float]) -> PriceSeries:
+        days = np.array(list(prices), dtype="datetime64[D]")
+        values = np.fromiter(prices.values(), dtype=np.float64, count=len(prices))
+        order = np.argsort(days, kind="stable")
+        return cls(days=days[order], values=values[order])
+
+    @classmethod
+    def from_arrays(cls, days: np.ndarray, values: np.ndarray) -> PriceSeries:
+        # Stable sort keeps repeated days in input order; keep the last of each
+        # run so a repeated day resolves like a dict built from the same rows.
+        order = np.argsort(days, kind="stable")
+        days = days.astype("datetime64[D]")[order]
+        values = values.astype(np.float64)[order]
+        last = np.ones(len(days), dtype=bool)
+        last[:-1] = days[1:] != days[:-1]
+        return cls(days=days[last], values=values[last])
+
+
+def dict_view(series: PriceSeries) -> dict[date, float]:
+    """Adapter for callers that still want a date -> close mapping."""
+    return dict(zip(series.days.tolist(), series.values.tolist()))
+
+
 def normalize_symbol(symbol: str) -> str:
     upper = symbol.upper()
     if upper not in _SYMBOL_MAP:
@@ -23,45 +59,127 @@ def normalize_symbol(symbol: str) -> str:
 def download_stooq_daily_csv(symbol: str) -> str:
     normalized = normalize_symbol(symbol)
     url = f"https://stooq.com/q/d/l/?s={normalized}&i=d"
-    with urlopen(url, timeout=30) as response:
-        return response.read().decode("utf-8")
-
-
-def parse_stooq_daily_csv(csv_text: str) -> dict[date, float]:
-    rows = csv.reader(csv_text.splitlines())
-    parsed: dict[date, float] = {}
-    header_seen = False
-    for row in rows:
-        if not row:
-            continue
-        if not header_seen:
-            header_seen = True
-            continue
-        if len(row) < 5:
-            continue
-        date_str = row[0].strip()
-        close_str = row[4].strip()
-        try:
-            year, month, day = (int(part) for part in date_str.split("-"))
-            close = float(close_str)
-        except (ValueError, TypeError):
-            continue
-        parsed[date(year, month, day)] = close
-    return parsed
+    # Multi-decade daily CSVs compress well; ask for gzip and inflate it here.
+    request = Request(url, headers={"Accept-Encoding": "gzip"})
+    with urlopen(request, timeout=30) as response:
+        payload = response.read()
+        if response.headers.get("Content-Encoding", "").lower() == "gzip":
+            payload = gzip.decompress(payload)
+    return payload.decode("utf-8")
 
 
-def get_prices(
-    symbol: str,
-    cache_dir: str = ".cache/stooq",
-    force_refresh: bool = False,
-) -> dict[date, float]:
+_CSV_DTYPE = np.dtype([("date", "datetime64[D]"), ("close", np.float64)])
+
+
+def parse_stooq_daily_csv(csv_text: str) -> tuple[np.ndarray, np.ndarray]:
+    """Return (days, closes) as datetime64[D] and float64 arrays in file order."""
+    # Fixed Stooq schema (Date,Open,High,Low,Close,Volume); the first line is the
+    # header. loadtxt parses it in C; malformed rows make it raise, in which case
+    # fall back to a tolerant line-by-line pass that skips them.
+    _, _, body = csv_text.partition("\n")
+    if not body.strip():
+        # Header only or an empty body (e.g. Stooq's "No data"); loadtxt would warn.
+        rows = np.empty(0, dtype=_CSV_DTYPE)
+        return rows["date"], rows["close"]
+    try:
+        rows = np.loadtxt(
+            io.StringIO(csv_text),
+            dtype=_CSV_DTYPE,
+            delimiter=",",
+            skiprows=1,
+            usecols=(0, 4),
+            ndmin=1,
+        )
+    except ValueError:
+        parsed: list[tuple[date, float]] = []
+        for line in csv_text.splitlines()[1:]:
+            parts = line.split(",")
+            if len(parts) < 5:
+                continue
+            try:
+                parsed.append((date.fromisoformat(parts[0].strip()), float(parts[4])))
+            except ValueError:
+                continue
+        rows = np.array(parsed, dtype=_CSV_DTYPE)
+    return rows["date"], rows["close"]
+
+
+def parse_stooq_daily_csv_dict(csv_text: str) -> dict[date, float]:
+    """Adapter returning the parsed closes as a date -> close mapping."""
+    days, closes = parse_stooq_daily_csv(csv_text)
+    return dict(zip(days.tolist(), closes.tolist()))
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write via temp file + rename so concurrent readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _write_parsed_cache(path: Path, series: PriceSeries) -> None:
+    buffer = io.BytesIO()
+    np.savez(buffer, dates=series.days, closes=series.values)
+    _write_atomic(path, buffer.getvalue())
+
+
+def _read_parsed_cache(path: Path, csv_path: Path) -> PriceSeries | None:
+    """Return the parsed prices if the .npz cache is at least as new as the CSV."""
+    try:
+        if path.stat().st_mtime_ns < csv_path.stat().st_mtime_ns:
+            return None
+        with np.load(path) as data:
+            return PriceSeries(days=data["dates"], values=data["closes"])
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def _load_prices(symbol: str, cache_dir: str, force_refresh: bool) -> PriceSeries:
     normalized = normalize_symbol(symbol)
     cache_path = Path(cache_dir) / f"{normalized}.csv"
+    parsed_path = cache_path.with_suffix(".npz")
     if cache_path.exists() and not force_refresh:
+        series = _read_parsed_cache(parsed_path, cache_path)
+        if series is not None:
+            return series
         csv_text = cache_path.read_text(encoding="utf-8")
-        return parse_stooq_daily_csv(csv_text)
+    else:
+        csv_text = download_stooq_daily_csv(symbol)
+        _write_atomic(cache_path, csv_text.encode("utf-8"))
 
-    csv_text = download_stooq_daily_csv(symbol)
-    cache_path.parent.mkdir(parents=True, exist_ok=True)
-    cache_path.write_text(csv_text, encoding="utf-8")
-    return parse_stooq_daily_csv(csv_text)
+    series = PriceSeries.from_arrays(*parse_stooq_daily_csv(csv_text))
+    _write_parsed_cache(parsed_path, series)
+    return series
+
+
+@lru_cache(maxsize=32)
+def _cached_prices(symbol: str, cache_dir: str) -> PriceSeries:
+    series = _load_prices(symbol, cache_dir, force_refresh=False)
+    # Shared by every caller in the process, so hand out read-only arrays.
+    series.days.setflags(write=False)
+    series.values.setflags(write=False)
+    return series
+
+
+def get_prices(
+    symbol: str,
+    cache_dir: str = ".cache/stooq",
+    force_refresh: bool = False,
+) -> PriceSeries:
+    """
+    Daily closes for symbol, memoized per process on (symbol, cache_dir).
+    force_refresh re-downloads and drops the in-process memo.
+    """
+    normalize_symbol(symbol)
+    if force_refresh:
+        _cached_prices.cache_clear()
+        return _load_prices(symbol, cache_dir, force_refresh=True)
+    return _cached_prices(symbol.upper(), cache_dir)
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from datetime import date
+
+import numpy as np
+
+
+def generate_weekdays(start: date, count: int) -> list[date]:
+    days = np.busday_offset(
+        np.datetime64(start, "D"), np.arange(count), roll="forward"
+    )
+    return days.tolist()
+
+
+def generate_prices(trading_days: list[date]) -> dict[str, dict[date, float]]:
+    idx = np.arange(len(trading_days))
+    spy = np.where(idx < 260, 100.0, 100.0 + (idx - 259) * 1.5)
+    bil = 100.0 + idx * 0.05
+    return {
+        "SPY": dict(zip(trading_days, spy.tolist())),
+        "BIL": dict(zip(trading_days, bil.tolist())),
+    }
@@ -1,60 +1,52 @@
 from __future__ import annotations
 
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date
+from functools import partial
 from pathlib import Path
-from typing import Mapping
+
+import numpy as np
 
 from sentinel_trend.backtest.engine import run_backtest
 from sentinel_trend.backtest.metrics import (
-    cagr,
-    max_drawdown,
+    compute_all_metrics,
     turnover_avg_equity,
     turnover_initial,
-    volatility,
 )
-from sentinel_trend.backtest.reports import write_decision_record
-from sentinel_trend.data.calendar import intersect_trading_days, trading_days_from_prices
+from sentinel_trend.backtest.reports import runs_dir, write_decision_record
+from sentinel_trend.data.aligned import load_aligned_prices
 from sentinel_trend.data.qa import run_all_checks
-from sentinel_trend.data.stooq import get_prices
-from sentinel_trend.strategy.trend_sma import make_trend_decisions
+from sentinel_trend.data.stooq import PriceSeries
+from sentinel_trend.strategy.trend_sma import make_trend_decision_arrays, price_cumsum
 
 
 def _iso_range(start: date, end: date) -> str:
     return f"{start.isoformat()} to {end.isoformat()}"
 
 
-def _restrict_prices(
-    prices: Mapping[date, float],
+def _run_variant_core(
+    sma_window: int,
+    cost_bps: float,
     trading_days: list[date],
-) -> dict[date, float]:
-    return {day: prices[day] for day in trading_days}
-
-
-def run_variant(sma_window: int, cost_bps: float, refresh: bool) -> dict:
-    cache_dir = ".cache/stooq"
-    spy_prices = get_prices("SPY", cache_dir=cache_dir, force_refresh=refresh)
-    bil_prices = get_prices("BIL", cache_dir=cache_dir, force_refresh=refresh)
-
-    trading_days = intersect_trading_days(
-        trading_days_from_prices(spy_prices),
-        trading_days_from_prices(bil_prices),
+    spy_prices: PriceSeries,
+    bil_prices: PriceSeries,
+    spy_csum: np.ndarray | None = None,
+    output_dir: Path | None = None,
+) -> dict:
+    decisions = make_trend_decision_arrays(
+        trading_days, spy_prices.values, window=sma_window, spy_csum=spy_csum
     )
-    spy_prices = _restrict_prices(spy_prices, trading_days)
-    bil_prices = _restrict_prices(bil_prices, trading_days)
-
-    decisions = make_trend_decisions(trading_days, spy_prices, window=sma_window)
     result = run_backtest(
         trading_days,
-        prices_by_asset={"SPY": spy_prices, "BIL": bil_prices},
+        prices_by_asset={"SPY": spy_prices.values, "BIL": bil_prices.values},
         decisions=decisions,
         initial_value=100_000.0,
         cost_bps=cost_bps,
     )
 
-    metrics = {
-        "cagr": cagr(result.equity_curve),
-        "max_drawdown": max_drawdown(result.equity_curve),
-        "volatility": volatility(result.equity_curve),
+    metrics = compute_all_metrics(result.equity_curve) | {
         "turnover_initial": turnover_initial(result.trades, result.initial_value),
         "turnover_avg_equity": turnover_avg_equity(
             result.trades, result.equity_curve
@@ -62,9 +54,9 @@ def run_variant(sma_window: int, cost_bps: float, refresh: bool) -> dict:
         "trade_count": len(result.trades),
     }
 
-    runs_dir = Path("runs")
-    runs_dir.mkdir(parents=True, exist_ok=True)
-    record_path = runs_dir / f"real_decision_record_{sma_window}.md"
+    if output_dir is None:
+        output_dir = runs_dir()
+    record_path = output_dir / f"real_decision_record_{sma_window}.md"
     config = {
         "assets": ["SPY", "BIL"],
         "sma_window": sma_window,
@@ -92,8 +84,30 @@ def run_variant(sma_window: int, cost_bps: float, refresh: bool) -> dict:
     }
 
 
+def run_variant(sma_window: int, cost_bps: float, refresh: bool) -> dict:
+    return _run_variant_core(sma_window, cost_bps, *load_aligned_prices(refresh))
+
+
 def compare_variants(windows: list[int], cost_bps: float, refresh: bool) -> dict:
-    results = [run_variant(window, cost_bps, refresh) for window in windows]
+    # Load (and, with refresh, download) once in this process, then fan the
+    # independent, CPU-bound variants out across worker processes.
+    trading_days, spy_prices, bil_prices = load_aligned_prices(refresh)
+    # Every window's SMA comes from the same prefix sums; compute them once.
+    run_one = partial(
+        _run_variant_core,
+        cost_bps=cost_bps,
+        trading_days=trading_days,
+        spy_prices=spy_prices,
+        bil_prices=bil_prices,
+        spy_csum=price_cumsum(spy_prices.values),
+        output_dir=runs_dir(),
+    )
+    workers = min(len(windows), os.cpu_count() or 1)
+    if workers < 2:
+        results = [run_one(window) for window in windows]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(run_one, windows))
     results.sort(key=lambda item: item["window"])
 
     cagr_values = [item["cagr"] for item in results]
@@ -114,52 +128,54 @@ def compare_variants(windows: list[int], cost_bps: float, refresh: bool) -> dict
     }
 
 
+def _row(item: dict) -> str:
+    return (
+        f"| {item['window']} | {item['cagr']:.4f} | {item['max_drawdown']:.4f} | "
+        f"{item['volatility']:.4f} | {item['turnover_avg_equity']:.4f} | "
+        f"{item['trade_count']} | {item['final_value']:,.2f} |\n"
+    )
+
+
 def write_research_report(path: str, comparison: dict, cost_bps: float) -> None:
     results = comparison["results"]
     windows = [item["window"] for item in results]
     date_range = results[0]["date_range"] if results else "n/a"
-
-    lines: list[str] = []
-    lines.append("# Research Report")
-    lines.append("")
-    lines.append("## Configuration")
-    lines.append(f"- Windows: {', '.join(str(w) for w in windows)}")
-    lines.append(f"- Cost (bps per side): {cost_bps}")
-    lines.append(f"- Date Range: {date_range}")
-    lines.append("")
-    lines.append("## Robustness Verdict")
     verdict = "robust" if comparison["robust"] else "not robust"
-    lines.append(f"- Verdict: {verdict}")
+
+    out = io.StringIO()
+    out.write(
+        "# Research Report\n"
+        "\n"
+        "## Configuration\n"
+        f"- Windows: {', '.join(str(w) for w in windows)}\n"
+        f"- Cost (bps per side): {cost_bps}\n"
+        f"- Date Range: {date_range}\n"
+        "\n"
+        "## Robustness Verdict\n"
+        f"- Verdict: {verdict}\n"
+    )
     if comparison["reasons"]:
-        lines.append("- Reasons:")
-        for reason in comparison["reasons"]:
-            lines.append(f"  - {reason}")
-    lines.append("")
-    lines.append("## Summary Table")
-    lines.append(
-        "| Window | CAGR | Max Drawdown | Volatility | Turnover (Avg Eq) | Trades | Final Value |"
+        out.write("- Reasons:\n")
+        out.writelines(f"  - {reason}\n" for reason in comparison["reasons"])
+    out.write(
+        "\n"
+        "## Summary Table\n"
+        "| Window | CAGR | Max Drawdown | Volatility | Turnover (Avg Eq) | Trades "
+        "| Final Value |\n"
+        "| --- | --- | --- | --- | --- | --- | --- |\n"
     )
-    lines.append("| --- | --- | --- | --- | --- | --- | --- |")
-    for item in results:
-        lines.append(
-            "| {window} | {cagr:.4f} | {max_drawdown:.4f} | {volatility:.4f} | "
-            "{turnover_avg_equity:.4f} | {trade_count} | {final_value:,.2f} |".format(
-                **item
-            )
-        )
-    lines.append("")
-    lines.append("## QA Warnings")
+    out.writelines(map(_row, results))
+    out.write("\n## QA Warnings\n")
     for item in results:
-        lines.append(f"- Window {item['window']}:")
+        out.write(f"- Window {item['window']}:\n")
         if item["qa_warnings"]:
-            for warning in item["qa_warnings"]:
-                lines.append(f"  - {warning}")
+            out.writelines(f"  - {warning}\n" for warning in item["qa_warnings"])
         else:
-            lines.append("  - None")
-    lines.append("")
-    lines.append("## Decision Records")
-    for item in results:
-        lines.append(f"- Window {item['window']}: {item['decision_record_path']}")
-    lines.append("")
+            out.write("  - None\n")
+    out.write("\n## Decision Records\n")
+    out.writelines(
+        f"- Window {item['window']}: {item['decision_record_path']}\n"
+        for item in results
+    )
 
-    Path(path).write_text("\n".join(lines), encoding="utf-8")
+    Path(path).write_text(out.getvalue(), encoding="utf-8")
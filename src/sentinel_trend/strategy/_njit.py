@@ -0,0 +1,15 @@
+"""Optional Numba JIT; without numba, njit leaves functions as plain Python."""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+try:
+    from numba import njit
+
+    HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - depends on the optional "jit" extra
+    HAVE_NUMBA = False
+
+    def njit(*args: Any, **kwargs: Any) -> Callable[[Callable], Callable]:
+        return lambda func: func
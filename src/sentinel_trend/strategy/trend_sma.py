@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import bisect
 from dataclasses import dataclass
 from datetime import date
 from typing import Literal, Mapping, Sequence
 
+import numpy as np
 
-@dataclass(frozen=True)
+from sentinel_trend.strategy._njit import HAVE_NUMBA, njit
+
+
+@dataclass(frozen=True, slots=True)
 class TrendDecision:
     signal_date: date
     trade_date: date
@@ -14,6 +19,56 @@ class TrendDecision:
     target_asset: Literal["SPY", "BIL"]
 
 
+# Asset for each TrendDecisions.target code: 0 = BIL, 1 = SPY.
+TARGET_ASSETS: tuple[Literal["BIL"], Literal["SPY"]] = ("BIL", "SPY")
+
+
+@dataclass(frozen=True)
+class TrendDecisions:
+    """
+    Column-oriented decisions. signal_idx/trade_idx index into the trading_days the
+    decisions were built from; target holds TARGET_ASSETS codes.
+    """
+
+    trading_days: Sequence[date]
+    signal_idx: np.ndarray
+    trade_idx: np.ndarray
+    spy_close: np.ndarray
+    sma: np.ndarray
+    target: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.signal_idx)
+
+    def __getitem__(self, i: int) -> TrendDecision:
+        return TrendDecision(
+            signal_date=self.trading_days[self.signal_idx[i]],
+            trade_date=self.trading_days[self.trade_idx[i]],
+            spy_close=float(self.spy_close[i]),
+            sma_200=float(self.sma[i]),
+            target_asset=TARGET_ASSETS[self.target[i]],
+        )
+
+    def to_list(self) -> list[TrendDecision]:
+        trading_days = self.trading_days
+        return [
+            TrendDecision(
+                signal_date=trading_days[signal],
+                trade_date=trading_days[trade],
+                spy_close=spy_close,
+                sma_200=sma,
+                target_asset=TARGET_ASSETS[target],
+            )
+            for signal, trade, spy_close, sma, target in zip(
+                self.signal_idx.tolist(),
+                self.trade_idx.tolist(),
+                self.spy_close.tolist(),
+                self.sma.tolist(),
+                self.target.tolist(),
+            )
+        ]
+
+
 def compute_sma(values: Sequence[float], window: int) -> float:
     if window <= 0:
         raise ValueError("window must be positive")
@@ -26,65 +81,133 @@ def decide_target(spy_close: float, sma: float) -> Literal["SPY", "BIL"]:
     return "SPY" if spy_close > sma else "BIL"
 
 
+def month_end_signal_indices(trading_days: Sequence[date]) -> np.ndarray:
+    """Indices into trading_days of the last trading day of each month."""
+    n_days = len(trading_days)
+    if n_days == 0:
+        return np.empty(0, dtype=np.intp)
+    year_month = np.fromiter(
+        (day.year * 12 + day.month for day in trading_days),
+        dtype=np.int32,
+        count=n_days,
+    )
+    changes = np.flatnonzero(year_month[1:] != year_month[:-1])
+    return np.append(changes, n_days - 1)
+
+
 def month_end_signal_dates(trading_days: Sequence[date]) -> list[date]:
+    # Pure-Python counterpart of month_end_signal_indices, keyed on the same
+    # year * 12 + month int so no per-day tuple or array is built.
     if not trading_days:
         return []
-
     month_ends: list[date] = []
     last_day = trading_days[0]
-    last_month = (last_day.year, last_day.month)
-
+    last_key = last_day.year * 12 + last_day.month
     for day in trading_days[1:]:
-        current_month = (day.year, day.month)
-        if current_month != last_month:
+        key = day.year * 12 + day.month
+        if key != last_key:
             month_ends.append(last_day)
-            last_month = current_month
+            last_key = key
         last_day = day
-
     month_ends.append(last_day)
     return month_ends
 
 
 def next_trading_day(trading_days: Sequence[date], d: date) -> date:
-    for day in trading_days:
-        if day > d:
-            return day
-    raise ValueError("no next trading day available")
-
-
-def make_trend_decisions(
+    # trading_days is ascending, so binary search for the first day after d.
+    idx = bisect.bisect_right(trading_days, d)
+    if idx >= len(trading_days):
+        raise ValueError("no next trading day available")
+    return trading_days[idx]
+
+
+@njit(cache=True)
+def _sma_signals(
+    prices: np.ndarray, signal_idx: np.ndarray, window: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Running-sum SMA and SPY/BIL target code at each (ascending) signal index, in a
+    single pass over prices. Only used when numba is available.
+    """
+    n_out = signal_idx.shape[0]
+    sma = np.empty(n_out, dtype=np.float64)
+    target = np.empty(n_out, dtype=np.int8)
+    running = 0.0
+    k = 0
+    for i in range(prices.shape[0]):
+        if k == n_out:
+            break
+        running += prices[i]
+        if i >= window:
+            running -= prices[i - window]
+        while k < n_out and signal_idx[k] == i:
+            value = running / window
+            sma[k] = value
+            target[k] = 1 if prices[i] > value else 0
+            k += 1
+    return sma, target
+
+
+def price_cumsum(prices: np.ndarray) -> np.ndarray:
+    """Prefix sums with a leading zero: csum[j] - csum[i] == prices[i:j].sum()."""
+    return np.concatenate(([0.0], np.cumsum(prices)))
+
+
+def make_trend_decision_arrays(
     trading_days: Sequence[date],
-    spy_adj_close: Mapping[date, float],
+    spy_adj_close: Mapping[date, float] | np.ndarray,
     window: int = 200,
-) -> list[TrendDecision]:
+    spy_csum: np.ndarray | None = None,
+) -> TrendDecisions:
+    """
+    Column-oriented make_trend_decisions; rows ascend by signal/trade date.
+    spy_adj_close may be an array aligned with trading_days; spy_csum, its
+    price_cumsum, lets callers comparing several windows share one cumsum.
+    """
     if window <= 0:
         raise ValueError("window must be positive")
 
-    index_by_date = {day: idx for idx, day in enumerate(trading_days)}
-    decisions: list[TrendDecision] = []
-
-    for signal_date in month_end_signal_dates(trading_days):
-        idx = index_by_date.get(signal_date)
-        if idx is None or idx + 1 < window:
-            continue
-        if idx >= len(trading_days) - 1:
-            continue
-
-        window_days = trading_days[idx - window + 1 : idx + 1]
-        window_values = [spy_adj_close[day] for day in window_days]
-        sma = compute_sma(window_values, window)
-        spy_close = spy_adj_close[signal_date]
-        trade_date = next_trading_day(trading_days, signal_date)
-        target = decide_target(spy_close, sma)
-
-        decisions.append(
-            TrendDecision(
-                signal_date=signal_date,
-                trade_date=trade_date,
-                spy_close=spy_close,
-                sma_200=sma,
-                target_asset=target,
-            )
+    n_days = len(trading_days)
+    if isinstance(spy_adj_close, np.ndarray):
+        if len(spy_adj_close) != n_days:
+            raise ValueError("spy_adj_close length must match trading_days")
+        prices = np.asarray(spy_adj_close, dtype=np.float64)
+    else:
+        # One lookup per day, up front; everything below indexes the array.
+        prices = np.fromiter(
+            (spy_adj_close[day] for day in trading_days),
+            dtype=np.float64,
+            count=n_days,
         )
+    month_ends = month_end_signal_indices(trading_days)
+    eligible = month_ends[(month_ends >= window - 1) & (month_ends < n_days - 1)]
+    spy_close = prices[eligible]
+
+    if spy_csum is None and HAVE_NUMBA:
+        sma_at_signal, target = _sma_signals(prices, eligible, window)
+    else:
+        # Window sums straight from the prefix sums, only at the signal days:
+        # prices[i - window + 1 : i + 1].sum() == csum[i + 1] - csum[i + 1 - window].
+        csum = price_cumsum(prices) if spy_csum is None else spy_csum
+        if len(csum) != n_days + 1:
+            raise ValueError("spy_csum length must be len(trading_days) + 1")
+        sma_at_signal = (csum[eligible + 1] - csum[eligible + 1 - window]) / window
+        target = (spy_close > sma_at_signal).astype(np.int8)
+
+    return TrendDecisions(
+        trading_days=trading_days,
+        signal_idx=eligible.astype(np.int32),
+        trade_idx=(eligible + 1).astype(np.int32),
+        spy_close=spy_close,
+        sma=sma_at_signal,
+        target=target,
+    )
 
-    return decisions
+
+def make_trend_decisions(
+    trading_days: Sequence[date],
+    spy_adj_close: Mapping[date, float],
+    window: int = 200,
+) -> list[TrendDecision]:
+    """Return one decision per eligible month end, ascending by signal/trade date."""
+    return make_trend_decision_arrays(trading_days, spy_adj_close, window).to_list()
@@ -1,8 +1,17 @@
 from __future__ import annotations
 
+import json
+from datetime import date
+
 import httpx
 import pytest
 from openai import RateLimitError
+from openai.types.responses import (
+    Response,
+    ResponseFunctionToolCall,
+    ResponseOutputMessage,
+    ResponseOutputText,
+)
 
 from sentinel_trend.agents import runner
 
@@ -28,3 +37,86 @@ def test_agent_runner_quota_error(monkeypatch) -> None:
     with pytest.raises(RuntimeError) as excinfo:
         runner.run_agent_research(refresh=False)
     assert "OpenAI API quota exceeded or billing not enabled" in str(excinfo.value)
+
+
+def test_parse_call_and_output_roundtrip() -> None:
+    name, args, call_id = runner._parse_call(
+        {
+            "name": "real_backtest",
+            "arguments": '{"sma_window": 200, "cost_bps": 5.0, "refresh": false}',
+            "call_id": "call_1",
+        }
+    )
+    assert name == "real_backtest"
+    assert args == {"sma_window": 200, "cost_bps": 5.0, "refresh": False}
+    assert call_id == "call_1"
+
+    payload = runner._json_dumps({"start": date(2023, 1, 3), "value": 1.5})
+    assert runner._json_loads(payload) == {"start": "2023-01-03", "value": 1.5}
+
+
+def test_json_dumps_int_keys_match_json() -> None:
+    # tool_compare_variants keys its results by window.
+    payload = {"results": {180: {"cagr": 0.05}, 200: {"cagr": 0.06}}}
+    assert runner._json_loads(runner._json_dumps(payload)) == json.loads(
+        json.dumps(payload)
+    )
+
+
+def test_agent_runner_tool_loop(tmp_path, monkeypatch) -> None:
+    responses = [
+        Response.model_construct(
+            id="resp_1",
+            output=[
+                ResponseFunctionToolCall(
+                    type="function_call",
+                    name="real_backtest",
+                    arguments='{"sma_window": 200, "cost_bps": 5.0}',
+                    call_id="call_1",
+                )
+            ],
+        ),
+        Response.model_construct(
+            id="resp_2",
+            output=[
+                ResponseOutputMessage(
+                    id="msg_1",
+                    type="message",
+                    role="assistant",
+                    status="completed",
+                    content=[
+                        ResponseOutputText(
+                            type="output_text", text="# Report", annotations=[]
+                        )
+                    ],
+                )
+            ],
+        ),
+    ]
+    requests: list[dict] = []
+
+    class DummyResponses:
+        def create(self, **kwargs):  # type: ignore[no-untyped-def]
+            requests.append(kwargs)
+            return responses[len(requests) - 1]
+
+    class DummyClient:
+        def __init__(self):  # type: ignore[no-untyped-def]
+            self.responses = DummyResponses()
+
+    def _stub_real_backtest(sma_window: int, cost_bps: float, refresh: bool) -> dict:
+        return {"sma_window": sma_window, "refresh": refresh}
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    monkeypatch.setattr(runner, "OpenAI", DummyClient)
+    monkeypatch.setattr(runner, "tool_real_backtest", _stub_real_backtest)
+
+    report_path = runner.run_agent_research(refresh=True)
+    assert (tmp_path / report_path).read_text(encoding="utf-8") == "# Report"
+    tool_output = requests[1]["input"][0]
+    assert tool_output["call_id"] == "call_1"
+    assert runner._json_loads(tool_output["output"]) == {
+        "sma_window": 200,
+        "refresh": True,
+    }
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+from pathlib import Path
+
 import pytest
 
 from sentinel_trend.agents import tools
 
 
 def test_compare_variants_keys(monkeypatch) -> None:
-    def _stub_real_backtest(sma_window: int, cost_bps: float, refresh: bool) -> dict:
+    def _stub_real_backtest(
+        sma_window: int, cost_bps: float, refresh: bool, output_dir: Path | None = None
+    ) -> dict:
         return {
             "cagr": 0.1 + sma_window * 0.0,
             "max_drawdown": -0.2,
@@ -18,7 +22,9 @@ def test_compare_variants_keys(monkeypatch) -> None:
 
 
 def test_compare_variants_robustness_flag(monkeypatch) -> None:
-    def _stub_real_backtest(sma_window: int, cost_bps: float, refresh: bool) -> dict:
+    def _stub_real_backtest(
+        sma_window: int, cost_bps: float, refresh: bool, output_dir: Path | None = None
+    ) -> dict:
         if sma_window == 180:
             return {"cagr": 0.03, "max_drawdown": -0.10}
         return {"cagr": 0.10, "max_drawdown": -0.25}
@@ -8,12 +8,17 @@ from sentinel_trend.backtest.costs import apply_cost
 from sentinel_trend.backtest.engine import run_backtest
 from sentinel_trend.backtest.metrics import (
     cagr,
+    compute_all_metrics,
+    equity_values,
     max_drawdown,
     turnover_avg_equity,
     turnover_initial,
     volatility,
 )
-from sentinel_trend.strategy.trend_sma import TrendDecision
+from sentinel_trend.strategy.trend_sma import (
+    TrendDecision,
+    make_trend_decision_arrays,
+)
 
 
 def generate_weekdays(start: date, count: int) -> list[date]:
@@ -83,6 +88,33 @@ def test_max_drawdown() -> None:
     assert max_drawdown(curve) == pytest.approx(-0.25)
 
 
+def test_metrics_accept_value_array() -> None:
+    curve = [
+        (date(2023, 1, 2), 100.0),
+        (date(2023, 1, 3), 120.0),
+        (date(2023, 1, 4), 90.0),
+        (date(2023, 1, 5), 110.0),
+    ]
+    values = equity_values(curve)
+    assert values.tolist() == [100.0, 120.0, 90.0, 110.0]
+    assert max_drawdown(values) == pytest.approx(max_drawdown(curve))
+    assert volatility(values) == pytest.approx(volatility(curve))
+
+
+def test_compute_all_metrics_matches_individual_metrics() -> None:
+    curve = [
+        (date(2023, 1, 2), 100.0),
+        (date(2023, 3, 3), 120.0),
+        (date(2023, 6, 4), 90.0),
+        (date(2024, 1, 5), 110.0),
+    ]
+    assert compute_all_metrics(curve) == {
+        "cagr": cagr(curve),
+        "max_drawdown": max_drawdown(curve),
+        "volatility": volatility(curve),
+    }
+
+
 def test_cagr_one_year_double() -> None:
     curve = [
         (date(2020, 1, 1), 100.0),
@@ -118,3 +150,21 @@ def test_turnover_avg_equity() -> None:
     average_equity = 150.0
     expected = 200.0 / average_equity
     assert turnover_avg_equity(trades, equity_curve) == pytest.approx(expected)
+
+
+def test_run_backtest_accepts_decision_arrays() -> None:
+    trading_days = generate_weekdays(date(2023, 1, 2), 300)
+    spy_prices = {
+        day: 100.0 + (idx % 40) * (1.0 if idx < 150 else -1.0)
+        for idx, day in enumerate(trading_days)
+    }
+    bil_prices = {day: 100.0 + idx * 0.01 for idx, day in enumerate(trading_days)}
+    prices_by_asset = {"SPY": spy_prices, "BIL": bil_prices}
+
+    decision_arrays = make_trend_decision_arrays(trading_days, spy_prices, window=50)
+    from_arrays = run_backtest(trading_days, prices_by_asset, decision_arrays)
+    from_list = run_backtest(trading_days, prices_by_asset, decision_arrays.to_list())
+
+    assert from_arrays.equity_curve == from_list.equity_curve
+    assert from_arrays.holdings == from_list.holdings
+    assert from_arrays.trades == from_list.trades
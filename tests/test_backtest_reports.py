@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+import shutil
+
+from sentinel_trend.backtest.reports import runs_dir
+
+
+def test_runs_dir_recreated_after_removal(tmp_path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    assert runs_dir().is_dir()
+    shutil.rmtree(tmp_path / "runs")
+    path = runs_dir()
+    assert str(path) == "runs"
+    assert (tmp_path / "runs").is_dir()
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from datetime import date
+
+from sentinel_trend.data import aligned
+from sentinel_trend.data.stooq import PriceSeries, dict_view
+
+
+def test_load_aligned_prices_loads_once(monkeypatch) -> None:
+    calls: list[str] = []
+
+    def _stub_get_prices(
+        symbol: str, cache_dir: str, force_refresh: bool
+    ) -> PriceSeries:
+        calls.append(symbol)
+        if symbol == "SPY":
+            return PriceSeries.from_prices(
+                {date(2023, 1, 3): 10.0, date(2023, 1, 4): 11.0}
+            )
+        return PriceSeries.from_prices({date(2023, 1, 4): 1.0, date(2023, 1, 5): 1.1})
+
+    monkeypatch.setattr(aligned, "_ALIGNED_PRICES", {})
+    monkeypatch.setattr(aligned, "get_prices", _stub_get_prices)
+    first = aligned.load_aligned_prices(False)
+    second = aligned.load_aligned_prices(False)
+    assert first is second
+    assert sorted(calls) == ["BIL", "SPY"]
+    assert first[0] == [date(2023, 1, 4)]
+    assert dict_view(first[1]) == {date(2023, 1, 4): 11.0}
+
+
+def test_load_aligned_prices_refresh_replaces_plain_entry(monkeypatch) -> None:
+    closes = {"SPY": 10.0, "BIL": 1.0}
+
+    def _stub_get_prices(
+        symbol: str, cache_dir: str, force_refresh: bool
+    ) -> PriceSeries:
+        return PriceSeries.from_prices({date(2023, 1, 4): closes[symbol]})
+
+    monkeypatch.setattr(aligned, "_ALIGNED_PRICES", {})
+    monkeypatch.setattr(aligned, "get_prices", _stub_get_prices)
+    stale = aligned.load_aligned_prices(False)
+    closes["SPY"] = 12.0
+    refreshed = aligned.load_aligned_prices(True)
+    assert dict_view(refreshed[1]) == {date(2023, 1, 4): 12.0}
+    assert aligned.load_aligned_prices(False) is refreshed
+    assert aligned.load_aligned_prices(False) is not stale
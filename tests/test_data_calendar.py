@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from datetime import date
+
+from sentinel_trend.data.calendar import (
+    align,
+    intersect_trading_days,
+    trading_days_from_prices,
+)
+from sentinel_trend.data.stooq import PriceSeries
+
+
+def test_trading_days_from_prices_sorts() -> None:
+    prices = {date(2023, 1, 4): 1.0, date(2023, 1, 3): 1.0}
+    assert trading_days_from_prices(prices) == [date(2023, 1, 3), date(2023, 1, 4)]
+
+
+def test_intersect_trading_days_merge() -> None:
+    a = [date(2023, 1, 2), date(2023, 1, 3), date(2023, 1, 5), date(2023, 1, 6)]
+    b = [date(2023, 1, 3), date(2023, 1, 4), date(2023, 1, 6), date(2023, 1, 9)]
+    assert intersect_trading_days(a, b) == [date(2023, 1, 3), date(2023, 1, 6)]
+    assert intersect_trading_days(a, []) == []
+
+
+def test_align_returns_shared_days_and_values() -> None:
+    a = PriceSeries.from_prices({date(2023, 1, 3): 1.0, date(2023, 1, 4): 2.0})
+    b = PriceSeries.from_prices({date(2023, 1, 4): 3.0, date(2023, 1, 5): 4.0})
+    common, a_values, b_values = align(a, b)
+    assert common.tolist() == [date(2023, 1, 4)]
+    assert a_values.tolist() == [2.0]
+    assert b_values.tolist() == [3.0]
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+import pytest
+
+from sentinel_trend.data import qa
+
+
+def generate_weekdays(start: date, count: int) -> list[date]:
+    days: list[date] = []
+    current = start
+    while len(days) < count:
+        if current.weekday() < 5:
+            days.append(current)
+        current += timedelta(days=1)
+    return days
+
+
+def test_check_missing_ratio_full_calendar() -> None:
+    trading_days = generate_weekdays(date(2023, 1, 6), 30)
+    assert qa.check_missing_ratio(trading_days) == []
+
+
+def test_check_missing_ratio_flags_gaps() -> None:
+    trading_days = generate_weekdays(date(2023, 1, 6), 30)
+    sparse = trading_days[:1] + trading_days[5:]
+    warnings = qa.check_missing_ratio(sparse)
+    assert len(warnings) == 1
+    assert "(observed 26, expected 30)" in warnings[0]
+
+
+def test_run_all_checks_flags_asset_issues() -> None:
+    trading_days = generate_weekdays(date(2023, 1, 6), 3)
+    prices_by_asset = {
+        "SPY": {trading_days[1]: 10.0, trading_days[0]: 11.0, trading_days[2]: 12.0},
+        "BIL": {day: 0.0 for day in trading_days},
+    }
+    assert qa.run_all_checks(prices_by_asset, trading_days) == [
+        "SPY dates are not strictly increasing",
+        "BIL has non-positive prices",
+    ]
+
+
+def test_run_all_checks_empty_prices_raises() -> None:
+    with pytest.raises(ValueError, match="SPY prices are empty"):
+        qa.run_all_checks({"SPY": {}}, [])
+
+
+def test_check_monotonic_dates_uses_insertion_order() -> None:
+    ordered = {date(2023, 1, 3): 1.0, date(2023, 1, 4): 1.0}
+    shuffled = {date(2023, 1, 4): 1.0, date(2023, 1, 3): 1.0}
+    assert qa.check_monotonic_dates(ordered, "SPY") == []
+    assert qa.check_monotonic_dates(shuffled, "SPY") == [
+        "SPY dates are not strictly increasing"
+    ]
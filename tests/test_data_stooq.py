@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import gzip
+import warnings
 from datetime import date
 
+import numpy as np
 import pytest
 
 from sentinel_trend.data import stooq
@@ -23,10 +26,52 @@ def test_parse_stooq_daily_csv() -> None:
             "2023-01-05,10,11,9,10.7,100",
         ]
     )
-    parsed = stooq.parse_stooq_daily_csv(csv_text)
+    parsed = stooq.parse_stooq_daily_csv_dict(csv_text)
     assert parsed[date(2023, 1, 3)] == 10.5
     assert len(parsed) == 3
 
+    days, closes = stooq.parse_stooq_daily_csv(csv_text)
+    assert days.dtype == np.dtype("datetime64[D]")
+    assert closes.tolist() == [10.5, 10.6, 10.7]
+
+
+def test_parse_stooq_daily_csv_skips_malformed_rows() -> None:
+    csv_text = "\n".join(
+        [
+            "Date,Open,High,Low,Close,Volume",
+            "2023-01-03,10,11,9,10.5,100",
+            "2023-01-04,10,11",
+            "2023-01-05,10,11,9,n/a,100",
+            "2023-01-06,10,11,9,10.7,100",
+        ]
+    )
+    assert stooq.parse_stooq_daily_csv_dict(csv_text) == {
+        date(2023, 1, 3): 10.5,
+        date(2023, 1, 6): 10.7,
+    }
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        for text in ("No data", "Date,Open,High,Low,Close,Volume\n"):
+            days, closes = stooq.parse_stooq_daily_csv(text)
+            assert len(days) == 0 and len(closes) == 0
+            assert days.dtype == np.dtype("datetime64[D]")
+
+
+def test_price_series_from_arrays_keeps_last_duplicate() -> None:
+    csv_text = "\n".join(
+        [
+            "Date,Open,High,Low,Close,Volume",
+            "2023-01-04,10,11,9,10.6,100",
+            "2023-01-03,10,11,9,10.5,100",
+            "2023-01-04,10,11,9,10.8,100",
+        ]
+    )
+    series = stooq.PriceSeries.from_arrays(*stooq.parse_stooq_daily_csv(csv_text))
+    assert stooq.dict_view(series) == stooq.parse_stooq_daily_csv_dict(csv_text)
+    assert series.values.tolist() == [10.5, 10.8]
+    empty = stooq.PriceSeries.from_arrays(*stooq.parse_stooq_daily_csv("No data"))
+    assert len(empty.days) == 0
+
 
 def test_get_prices_uses_cache(tmp_path, monkeypatch) -> None:
     cache_dir = tmp_path / "stooq"
@@ -42,7 +87,7 @@ def test_get_prices_uses_cache(tmp_path, monkeypatch) -> None:
 
     monkeypatch.setattr(stooq, "download_stooq_daily_csv", _fail_download)
     prices = stooq.get_prices("SPY", cache_dir=str(cache_dir), force_refresh=False)
-    assert prices[date(2023, 1, 3)] == 10.5
+    assert stooq.dict_view(prices)[date(2023, 1, 3)] == 10.5
 
 
 def test_get_prices_force_refresh(tmp_path, monkeypatch) -> None:
@@ -57,4 +102,73 @@ def test_get_prices_force_refresh(tmp_path, monkeypatch) -> None:
 
     monkeypatch.setattr(stooq, "download_stooq_daily_csv", _download)
     prices = stooq.get_prices("SPY", cache_dir=str(cache_dir), force_refresh=True)
-    assert prices[date(2023, 1, 3)] == 10.5
+    assert stooq.dict_view(prices)[date(2023, 1, 3)] == 10.5
+
+
+def test_get_prices_reads_parsed_cache(tmp_path, monkeypatch) -> None:
+    cache_dir = tmp_path / "stooq"
+    cache_dir.mkdir()
+    (cache_dir / "spy.us.csv").write_text(
+        "Date,Open,High,Low,Close,Volume\n2023-01-03,10,11,9,10.5,100\n",
+        encoding="utf-8",
+    )
+
+    first = stooq.get_prices("SPY", cache_dir=str(cache_dir))
+    assert (cache_dir / "spy.us.npz").exists()
+
+    def _fail_parse(csv_text: str) -> tuple:
+        raise AssertionError("CSV should not be re-parsed")
+
+    monkeypatch.setattr(stooq, "parse_stooq_daily_csv", _fail_parse)
+    stooq._cached_prices.cache_clear()
+    second = stooq.get_prices("SPY", cache_dir=str(cache_dir))
+    assert stooq.dict_view(second) == stooq.dict_view(first)
+    assert second.days.dtype == np.dtype("datetime64[D]")
+
+
+def test_download_stooq_daily_csv_gzip(monkeypatch) -> None:
+    csv_text = "Date,Open,High,Low,Close,Volume\n2023-01-03,10,11,9,10.5,100\n"
+    seen: dict[str, object] = {}
+
+    class _Response:
+        headers = {"Content-Encoding": "gzip"}
+
+        def __enter__(self):  # type: ignore[no-untyped-def]
+            return self
+
+        def __exit__(self, *exc):  # type: ignore[no-untyped-def]
+            return False
+
+        def read(self) -> bytes:
+            return gzip.compress(csv_text.encode("utf-8"))
+
+    def _urlopen(request, timeout: float):  # type: ignore[no-untyped-def]
+        seen["url"] = request.full_url
+        seen["encoding"] = request.get_header("Accept-encoding")
+        return _Response()
+
+    monkeypatch.setattr(stooq, "urlopen", _urlopen)
+    assert stooq.download_stooq_daily_csv("spy") == csv_text
+    assert seen["url"] == "https://stooq.com/q/d/l/?s=spy.us&i=d"
+    assert seen["encoding"] == "gzip"
+
+
+def test_get_prices_memoized_in_process(tmp_path, monkeypatch) -> None:
+    cache_dir = tmp_path / "stooq"
+    cache_dir.mkdir()
+    (cache_dir / "spy.us.csv").write_text(
+        "Date,Open,High,Low,Close,Volume\n2023-01-03,10,11,9,10.5,100\n",
+        encoding="utf-8",
+    )
+
+    first = stooq.get_prices("SPY", cache_dir=str(cache_dir))
+    assert stooq.get_prices("spy", cache_dir=str(cache_dir)) is first
+    assert not first.values.flags.writeable
+
+    def _download(symbol: str) -> str:
+        return "Date,Open,High,Low,Close,Volume\n2023-01-03,10,11,9,11.5,100\n"
+
+    monkeypatch.setattr(stooq, "download_stooq_daily_csv", _download)
+    refreshed = stooq.get_prices("SPY", cache_dir=str(cache_dir), force_refresh=True)
+    assert stooq.dict_view(refreshed) == {date(2023, 1, 3): 11.5}
+    assert stooq.get_prices("SPY", cache_dir=str(cache_dir)) is not first
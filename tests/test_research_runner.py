@@ -1,19 +1,46 @@
 from __future__ import annotations
 
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+
+from sentinel_trend.data import aligned, stooq
+from sentinel_trend.data.stooq import PriceSeries
+from sentinel_trend.data.synthetic import generate_weekdays
 from sentinel_trend.research import runner
 
 
+def _stub_load_prices(refresh: bool) -> tuple:
+    empty = PriceSeries(
+        days=np.array([], dtype="datetime64[D]"), values=np.array([], dtype=np.float64)
+    )
+    return [], empty, empty
+
+
+# Module level so compare_variants can pickle it into worker processes.
+def _stub_run_variant_core(
+    window: int,
+    cost_bps: float,
+    trading_days: list,
+    spy_prices: PriceSeries,
+    bil_prices: PriceSeries,
+    spy_csum: np.ndarray | None = None,
+    output_dir: Path | None = None,
+) -> dict:
+    if window == 180:
+        return {"window": window, "cagr": 0.01, "max_drawdown": -0.10}
+    if window == 200:
+        return {"window": window, "cagr": 0.06, "max_drawdown": -0.30}
+    return {"window": window, "cagr": 0.03, "max_drawdown": -0.15}
+
+
 def test_compare_variants_not_robust(monkeypatch) -> None:
-    def _stub_run_variant(window: int, cost_bps: float, refresh: bool) -> dict:
-        if window == 180:
-            return {"window": window, "cagr": 0.01, "max_drawdown": -0.10}
-        if window == 200:
-            return {"window": window, "cagr": 0.06, "max_drawdown": -0.30}
-        return {"window": window, "cagr": 0.03, "max_drawdown": -0.15}
-
-    monkeypatch.setattr(runner, "run_variant", _stub_run_variant)
+    monkeypatch.setattr(runner, "load_aligned_prices", _stub_load_prices)
+    monkeypatch.setattr(runner, "_run_variant_core", _stub_run_variant_core)
     comparison = runner.compare_variants([180, 200, 220], cost_bps=5.0, refresh=False)
     assert comparison["robust"] is False
+    assert [item["window"] for item in comparison["results"]] == [180, 200, 220]
 
 
 def test_write_research_report_contains_headers(tmp_path) -> None:
@@ -40,3 +67,50 @@ def test_write_research_report_contains_headers(tmp_path) -> None:
     content = report_path.read_text(encoding="utf-8")
     assert "| Window | CAGR | Max Drawdown | Volatility | Turnover (Avg Eq) | Trades | Final Value |" in content
     assert "Verdict: robust" in content
+
+
+def test_compare_variants_process_pool_matches_serial(monkeypatch) -> None:
+    monkeypatch.setattr(runner, "load_aligned_prices", _stub_load_prices)
+    monkeypatch.setattr(runner, "_run_variant_core", _stub_run_variant_core)
+    monkeypatch.setattr(runner.os, "cpu_count", lambda: 1)
+    serial = runner.compare_variants([220, 180, 200], cost_bps=5.0, refresh=False)
+    monkeypatch.setattr(runner.os, "cpu_count", lambda: 4)
+    pooled = runner.compare_variants([220, 180, 200], cost_bps=5.0, refresh=False)
+    assert pooled == serial
+
+
+def _write_stooq_csv(path, days: list[date], closes: np.ndarray) -> None:
+    rows = [
+        f"{day.isoformat()},1,1,1,{close:.4f},100" for day, close in zip(days, closes)
+    ]
+    path.write_text(
+        "Date,Open,High,Low,Close,Volume\n" + "\n".join(rows) + "\n",
+        encoding="utf-8",
+    )
+
+
+def test_compare_variants_matches_run_variant(tmp_path, monkeypatch) -> None:
+    cache_dir = tmp_path / ".cache" / "stooq"
+    cache_dir.mkdir(parents=True)
+    days = generate_weekdays(date(2021, 1, 4), 400)
+    rng = np.random.default_rng(11)
+    spy = 100.0 * np.cumprod(1.0 + rng.normal(0.0, 0.015, size=len(days)))
+    bil = 100.0 * np.cumprod(1.0 + rng.normal(0.0002, 0.0005, size=len(days)))
+    _write_stooq_csv(cache_dir / "spy.us.csv", days, spy)
+    _write_stooq_csv(cache_dir / "bil.us.csv", days[5:], bil[5:])
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(aligned, "_ALIGNED_PRICES", {})
+    monkeypatch.setattr(runner.os, "cpu_count", lambda: 1)
+    stooq._cached_prices.cache_clear()
+    try:
+        comparison = runner.compare_variants(
+            [20, 40, 60], cost_bps=5.0, refresh=False
+        )
+        expected = [
+            runner.run_variant(window, cost_bps=5.0, refresh=False)
+            for window in (20, 40, 60)
+        ]
+    finally:
+        stooq._cached_prices.cache_clear()
+    assert comparison["results"] == expected
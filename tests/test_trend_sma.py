@@ -2,14 +2,17 @@ from __future__ import annotations
 
 from datetime import date, timedelta
 
+import numpy as np
 import pytest
 
+from sentinel_trend.strategy import trend_sma
 from sentinel_trend.strategy.trend_sma import (
     TrendDecision,
     compute_sma,
     decide_target,
     make_trend_decisions,
     month_end_signal_dates,
+    month_end_signal_indices,
     next_trading_day,
 )
 
@@ -57,6 +60,24 @@ def test_month_end_signal_dates() -> None:
     ]
 
 
+def test_month_end_signal_indices() -> None:
+    trading_days = [
+        date(2023, 1, 30),
+        date(2023, 1, 31),
+        date(2023, 2, 1),
+        date(2023, 3, 1),
+    ]
+    assert month_end_signal_indices(trading_days).tolist() == [1, 2, 3]
+    assert month_end_signal_indices([]).tolist() == []
+
+
+def test_month_end_signal_dates_matches_indices() -> None:
+    trading_days = generate_weekdays(date(2021, 12, 20), 300)
+    expected = [trading_days[i] for i in month_end_signal_indices(trading_days)]
+    assert month_end_signal_dates(trading_days) == expected
+    assert month_end_signal_dates([]) == []
+
+
 def test_next_trading_day() -> None:
     trading_days = [date(2023, 1, 2), date(2023, 1, 3), date(2023, 1, 5)]
     assert next_trading_day(trading_days, date(2023, 1, 2)) == date(2023, 1, 3)
@@ -95,3 +116,51 @@ def test_make_trend_decisions() -> None:
     window_days = trading_days[first_idx - 200 + 1 : first_idx + 1]
     expected_sma = sum(prices[d] for d in window_days) / 200
     assert first.sma_200 == expected_sma
+
+
+def test_sma_signals_matches_cumsum_sma() -> None:
+    rng = np.random.default_rng(7)
+    prices = 100.0 * np.cumprod(1.0 + rng.normal(0.0, 0.01, size=1500))
+    window = 200
+    signal_idx = np.arange(window - 1, len(prices) - 1, 21)
+
+    sma, target = trend_sma._sma_signals(prices, signal_idx, window)
+
+    csum = np.concatenate(([0.0], np.cumsum(prices)))
+    expected = (csum[window:] - csum[:-window])[signal_idx - window + 1] / window
+    assert np.allclose(sma, expected, rtol=1e-12, atol=0.0)
+    assert target.tolist() == (prices[signal_idx] > expected).astype(int).tolist()
+
+
+@pytest.mark.parametrize("have_numba", [True, False])
+def test_decision_arrays_accept_aligned_price_array(monkeypatch, have_numba) -> None:
+    if have_numba and not trend_sma.HAVE_NUMBA:
+        pytest.skip("numba not installed")
+    monkeypatch.setattr(trend_sma, "HAVE_NUMBA", have_numba)
+    trading_days = generate_weekdays(date(2021, 1, 4), 400)
+    rng = np.random.default_rng(3)
+    prices = 100.0 * np.cumprod(1.0 + rng.normal(0.0, 0.01, size=len(trading_days)))
+
+    from_array = trend_sma.make_trend_decision_arrays(trading_days, prices, window=50)
+    from_dict = trend_sma.make_trend_decision_arrays(
+        trading_days, dict(zip(trading_days, prices.tolist())), window=50
+    )
+    assert from_array.to_list() == from_dict.to_list()
+    with pytest.raises(ValueError):
+        trend_sma.make_trend_decision_arrays(trading_days, prices[:-1], window=50)
+
+
+def test_decision_arrays_with_shared_cumsum() -> None:
+    trading_days = generate_weekdays(date(2021, 1, 4), 400)
+    rng = np.random.default_rng(5)
+    prices = 100.0 * np.cumprod(1.0 + rng.normal(0.0, 0.01, size=len(trading_days)))
+    csum = trend_sma.price_cumsum(prices)
+    for window in (20, 50, 80):
+        shared = trend_sma.make_trend_decision_arrays(
+            trading_days, prices, window=window, spy_csum=csum
+        )
+        alone = trend_sma.make_trend_decision_arrays(
+            trading_days, prices, window=window
+        )
+        assert np.allclose(shared.sma, alone.sma, rtol=1e-12, atol=0.0)
+        assert shared.target.tolist() == alone.target.tolist()